@@ -25,58 +25,58 @@ activities = {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     },
     # Sports related activities
     "Soccer Team": {
         "description": "Join the school soccer team and compete in local leagues",
         "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
         "max_participants": 18,
-        "participants": ["lucas@mergington.edu", "mia@mergington.edu"]
+        "participants": {"lucas@mergington.edu", "mia@mergington.edu"}
     },
     "Basketball Club": {
         "description": "Practice basketball skills and play friendly matches",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 15,
-        "participants": ["liam@mergington.edu", "ava@mergington.edu"]
+        "participants": {"liam@mergington.edu", "ava@mergington.edu"}
     },
     # Artistic activities
     "Art Club": {
         "description": "Explore painting, drawing, and other visual arts",
         "schedule": "Mondays, 3:30 PM - 5:00 PM",
         "max_participants": 16,
-        "participants": ["noah@mergington.edu", "isabella@mergington.edu"]
+        "participants": {"noah@mergington.edu", "isabella@mergington.edu"}
     },
     "Drama Society": {
         "description": "Participate in theater productions and acting workshops",
         "schedule": "Thursdays, 4:00 PM - 5:30 PM",
         "max_participants": 20,
-        "participants": ["amelia@mergington.edu", "benjamin@mergington.edu"]
+        "participants": {"amelia@mergington.edu", "benjamin@mergington.edu"}
     },
     # Intellectual activities
     "Math Olympiad": {
         "description": "Prepare for math competitions and solve challenging problems",
         "schedule": "Fridays, 2:00 PM - 3:30 PM",
         "max_participants": 10,
-        "participants": ["charlotte@mergington.edu", "elijah@mergington.edu"]
+        "participants": {"charlotte@mergington.edu", "elijah@mergington.edu"}
     },
     "Debate Club": {
         "description": "Develop public speaking and argumentation skills",
         "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
         "max_participants": 14,
-        "participants": ["william@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"william@mergington.edu", "sophia@mergington.edu"}
     }
 }
 
@@ -88,7 +88,11 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Participants are stored as sets; return them as sorted lists
+    return {
+        name: {**details, "participants": sorted(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -106,7 +110,7 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
 
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -1,48 +1,58 @@
 """
 Test configuration and fixtures for the FastAPI application.
 """
+import json
+from types import MappingProxyType
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
 from src.app import app, activities
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+# Snapshot of the in-memory database, serialized once at import time;
+# json.loads rebuilds it faster than copy.deepcopy
+_INITIAL_JSON = json.dumps(activities, default=sorted)
+
+
+def _load_initial_activities():
+    """Rebuild the initial activities, restoring participants as sets."""
+    data = json.loads(_INITIAL_JSON)
+    for details in data.values():
+        details["participants"] = set(details["participants"])
+    return data
+
+
+def _freeze(value):
+    """Return a read-only copy of decoded JSON: mappings become proxies, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@pytest.fixture(scope="session")
+async def client():
+    """Create an async client that calls the FastAPI app in-process, shared by the session."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def activities_snapshot():
+    """Read-only view of the initial activities as returned by GET /activities."""
+    return _freeze(json.loads(_INITIAL_JSON))
 
 
 @pytest.fixture
 def reset_activities():
     """Reset activities to initial state before each test."""
-    # Store original activities
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
-    
-    # Reset activities to original state
     activities.clear()
-    activities.update(original_activities)
-    
+    activities.update(_load_initial_activities())
+
     yield
-    
+
     # Cleanup after test
     activities.clear()
-    activities.update(original_activities)
\ No newline at end of file
+    activities.update(_load_initial_activities())
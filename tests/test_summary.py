@@ -1,53 +0,0 @@
-"""
-Test summary and documentation for the Mergington High School Activities API test suite.
-
-This test suite provides comprehensive coverage of the FastAPI application including:
-
-1. Core API functionality (test_activities.py):
-   - Activity retrieval
-   - Student signup
-   - Participant unregistration
-   - Error handling for various edge cases
-
-2. Integration tests (test_integration.py):
-   - Static file serving
-   - URL encoding handling
-   - Edge cases with special characters
-   - Validation error handling
-
-3. Performance tests (test_performance.py):
-   - Concurrent operations
-   - Rapid signup/unregister cycles
-   - Data consistency verification
-   - Performance benchmarks
-
-Test Coverage: 100% of src/app.py code
-Total Tests: 23 tests
-All tests passing ✅
-
-Key Features Tested:
-- ✅ GET /activities - Retrieve all activities
-- ✅ POST /activities/{activity_name}/signup - Register participant
-- ✅ DELETE /activities/{activity_name}/participants/{email} - Unregister participant
-- ✅ Static file serving (/static/*)
-- ✅ Error handling (404, 400, 422)
-- ✅ Data validation and consistency
-- ✅ Concurrent operations
-- ✅ URL encoding/decoding
-- ✅ Performance under load
-
-Dependencies Added:
-- pytest: Testing framework
-- httpx: HTTP client for FastAPI testing
-- pytest-cov: Coverage reporting
-
-To run tests:
-    python -m pytest tests/ -v
-    
-To run with coverage:
-    python -m pytest tests/ --cov=src --cov-report=term-missing
-"""
-
-def test_documentation():
-    """This test serves as documentation and always passes."""
-    assert True, "All tests documented and working correctly"
\ No newline at end of file